@@ -37,17 +37,22 @@ def graphrag_app(initialized: bool):
         api_url = st.session_state[EnvVars.DEPLOYMENT_URL.value]
         apim_key = st.session_state[EnvVars.APIM_SUBSCRIPTION_KEY.value]
         client = GraphragAPI(api_url, apim_key)
-        indexPipe = IndexPipeline(client, COLUMN_WIDTHS)
+        # fetch storage container and index names concurrently and share the
+        # results across tabs to avoid repeating the same requests per tab
+        storage_names, index_names = client.get_storage_and_index_names()
+        indexPipe = IndexPipeline(client, COLUMN_WIDTHS, containers=storage_names)
 
         # display tabs
         with prompt_gen_tab:
-            tabs.get_prompt_generation_tab(client, COLUMN_WIDTHS)
+            tabs.get_prompt_generation_tab(
+                client, COLUMN_WIDTHS, storage_containers=storage_names
+            )
         with prompt_edit_tab:
             tabs.get_prompt_configuration_tab()
         with index_tab:
             tabs.get_index_tab(indexPipe)
         with query_tab:
-            tabs.get_query_tab(client)
+            tabs.get_query_tab(client, index_names=index_names)
 
     deployer_email = os.getenv("DEPLOYER_EMAIL", "deployer@email.com")
 
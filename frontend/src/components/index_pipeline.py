@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import functools
 from io import StringIO
 
 import streamlit as st
@@ -11,11 +12,30 @@ from src.functions import GraphragAPI
 
 
 class IndexPipeline:
-    def __init__(self, client: GraphragAPI, column_widths: list[float]) -> None:
+    def __init__(
+        self,
+        client: GraphragAPI,
+        column_widths: list[float],
+        containers: list[str] | None = None,
+    ) -> None:
         self.client = client
-        self.containers = client.get_storage_container_names()
+        self.containers = (
+            containers
+            if containers is not None
+            else client.get_storage_container_names()
+        )
         self.column_widths = column_widths
 
+    @functools.cached_property
+    def _container_options(self) -> list[str]:
+        """
+        Selectbox options for the storage container dropdown, built once per
+        pipeline instance instead of once per step that renders it.
+        """
+        if isinstance(self.containers, list):
+            return [""] + self.containers
+        return []
+
     def storage_data_step(self):
         """
         Builds the Storage Data Step for the Indexing Pipeline.
@@ -32,9 +52,7 @@ class IndexPipeline:
             )
             select_storage_name = st.selectbox(
                 label="Select an existing Storage Container.",
-                options=[""] + self.containers
-                if isinstance(self.containers, list)
-                else [],
+                options=self._container_options,
                 key="index-storage",
                 index=0,
             )
@@ -16,7 +16,7 @@ from src.components.prompt_configuration import (
 from src.components.query import GraphQuery
 from src.components.upload_files_component import upload_files
 from src.enums import PromptKeys
-from src.functions import generate_and_extract_prompts
+from src.functions import fetch_prompts_into_session
 from src.graphrag_api import GraphragAPI
 
 
@@ -59,6 +59,7 @@ def get_prompt_generation_tab(
     client: GraphragAPI,
     column_widths: list[float],
     num_chunks: int = 5,
+    storage_containers: list[str] | None = None,
 ) -> None:
     """
     Displays content of Prompt Generation Tab
@@ -76,7 +77,8 @@ def get_prompt_generation_tab(
         st.write(
             "Select a storage container that contains your data. GraphRAG will use this data to generate domain-specific prompts for follow-on indexing."
         )
-        storage_containers = client.get_storage_container_names()
+        if storage_containers is None:
+            storage_containers = client.get_storage_container_names()
 
         # if no storage containers, allow user to upload files
         if isinstance(storage_containers, list) and not (any(storage_containers)):
@@ -123,7 +125,7 @@ def get_prompt_generation_tab(
             )
             if triggered:
                 with st.spinner("Generating LLM prompts for GraphRAG..."):
-                    generated = generate_and_extract_prompts(
+                    generated = fetch_prompts_into_session(
                         client=client,
                         storage_name=select_prompt_storage,
                         limit=num_chunks,
@@ -139,7 +141,7 @@ def get_prompt_generation_tab(
                         )
                         while num_chunks > 1:
                             num_chunks -= 1
-                            generated = generate_and_extract_prompts(
+                            generated = fetch_prompts_into_session(
                                 client=client,
                                 storage_name=select_prompt_storage,
                                 limit=num_chunks,
@@ -228,7 +230,7 @@ def execute_query(
         return st.warning("Please enter a query to search.")
 
 
-def get_query_tab(client: GraphragAPI) -> None:
+def get_query_tab(client: GraphragAPI, index_names: list | None = None) -> None:
     """
     Displays content of Query Tab
     """
@@ -241,7 +243,9 @@ def get_query_tab(client: GraphragAPI) -> None:
             help="Select the query type - Each yeilds different results of specificity. Global queries focus on the entire graph structure. Local queries focus on a set of communities (subgraphs) in the graph that are more connected to each other than they are to the rest of the graph structure and can focus on very specific entities in the graph. Global streaming is a global query that displays results as they appear live.",
         )
     with col2:
-        search_indexes = client.get_index_names()
+        search_indexes = (
+            index_names if index_names is not None else client.get_index_names()
+        )
         if not any(search_indexes):
             st.warning("No indexes found. Please build an index to continue.")
         select_index_search = st.multiselect(
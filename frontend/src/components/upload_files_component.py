@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 import streamlit as st
 
@@ -40,17 +40,57 @@ def upload_files(
     )
     if uploaded:
         if file_upload and input_storage_name != "":
-            file_payloads = []
-            for file in file_upload:
-                file_payload = (
-                    "files",
-                    (file.name, file.read(), file.type),
-                )
-                file_payloads.append((file_payload))
-
-            response = client.upload_files(file_payloads, input_storage_name)
-            if response.status_code == 200:
+            # getvalue() returns the buffered bytes without advancing the
+            # cursor the way read() does, so retries need no re-seek
+            file_payloads = [
+                ("files", (file.name, file.getvalue(), file.type))
+                for file in file_upload
+            ]
+            # the first file uploads alone so the backend creates the target
+            # container exactly once - parallel first uploads race its
+            # exists()/create_container() check and the losers error out
+            first_response = client.upload_files([file_payloads[0]], input_storage_name)
+            responses = [first_response]
+            first_ok = first_response is not None and first_response.status_code == 200
+            # the remaining files upload concurrently - wall time becomes the
+            # slowest single upload rather than the sum, and one failed file
+            # no longer aborts the whole batch
+            if first_ok and len(file_payloads) > 1:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    responses += list(
+                        executor.map(
+                            lambda payload: client.upload_files(
+                                [payload], input_storage_name
+                            ),
+                            file_payloads[1:],
+                        )
+                    )
+            failures = [
+                response
+                for response in responses
+                if response is None or response.status_code != 200
+            ]
+            if len(failures) < len(responses):
+                # at least one upload landed; invalidate the cached name
+                # lists once here instead of from every worker thread
+                client.clear_name_caches()
+            if not failures:
                 st.success("Files uploaded successfully!")
             else:
-                st.error(f"Error: {json.loads(response.text)}")
+                skipped = len(file_payloads) - len(responses)
+                message = (
+                    f"Failed to upload {len(failures)} of {len(file_payloads)} files."
+                )
+                if skipped:
+                    message += (
+                        f" {skipped} files were skipped because the first"
+                        " upload failed."
+                    )
+                st.error(message)
+                for response in failures:
+                    if response is not None:
+                        try:
+                            st.error(f"Error: {response.json()}")
+                        except ValueError:
+                            st.error(f"Error: {response.text[:512]}")
     return uploaded
@@ -1,8 +1,9 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import asyncio
 import os
-from pathlib import Path
+from io import BytesIO
 from typing import Optional
 from zipfile import ZipFile
 
@@ -62,42 +63,35 @@ def initialize_app(env_file: str = ".env", css_file: str = "style.css") -> bool:
         return False
 
 
+# enum values are materialized once at import so per-rerun initialization is
+# a plain tuple walk instead of three enum iterations per script execution
+_SESSION_STATE_STRING_KEYS = tuple(
+    key.value
+    for enum_cls in (PromptKeys, StorageIndexVars, EnvVars)
+    for key in enum_cls
+)
+_SESSION_STATE_FLAG_KEYS = ("saved_prompts", "initialized", "new_upload")
+
+
 def set_session_state_variables() -> None:
     """
     Initalizes most session state variables for the app.
     """
-    for key in PromptKeys:
-        value = key.value
-        if value not in st.session_state:
-            st.session_state[value] = ""
-    for key in StorageIndexVars:
-        value = key.value
-        if value not in st.session_state:
-            st.session_state[value] = ""
-    for key in EnvVars:
-        value = key.value
-        if value not in st.session_state:
-            st.session_state[value] = ""
-    if "saved_prompts" not in st.session_state:
-        st.session_state["saved_prompts"] = False
-    if "initialized" not in st.session_state:
-        st.session_state["initialized"] = False
-    if "new_upload" not in st.session_state:
-        st.session_state["new_upload"] = False
+    session_state = st.session_state
+    for key in _SESSION_STATE_STRING_KEYS:
+        session_state.setdefault(key, "")
+    for key in _SESSION_STATE_FLAG_KEYS:
+        session_state.setdefault(key, False)
 
 
 def update_session_state_prompt_vars(
     entity_extract: Optional[str] = None,
     summarize: Optional[str] = None,
     community: Optional[str] = None,
-    initial_setting: bool = False,
-    prompt_dir: str = "./prompts",
 ) -> None:
     """
     Updates the session state variables for the LLM prompts.
     """
-    if initial_setting:
-        entity_extract, summarize, community = get_prompts(prompt_dir)
     if entity_extract:
         st.session_state[PromptKeys.ENTITY.value] = entity_extract
     if summarize:
@@ -106,36 +100,61 @@ def update_session_state_prompt_vars(
         st.session_state[PromptKeys.COMMUNITY.value] = community
 
 
-def generate_and_extract_prompts(
+def fetch_prompts_into_session(
     client: GraphragAPI,
     storage_name: str,
-    zip_file_name: str = "prompts.zip",
     limit: int = 5,
 ) -> None | Exception:
     """
-    Makes API call to generate LLM prompts, extracts prompts from zip file,
-    and updates the prompt session state variables.
+    Single pipeline behind the Generate Prompts button: stream the zip of
+    generated prompts into memory and decode the three members straight
+    into the prompt session state variables.  Each prompt's bytes are
+    touched once (HTTP read plus zip decode) with no intermediate files.
     """
     try:
-        client.generate_prompts(
-            storage_name=storage_name, zip_file_name=zip_file_name, limit=limit
-        )
-        _extract_prompts_from_zip(zip_file_name)
-        update_session_state_prompt_vars(initial_setting=True)
+        asyncio.run(_fetch_prompts_into_session(client, storage_name, limit))
         return
     except Exception as e:
         return e
 
 
-def _extract_prompts_from_zip(zip_file_name: str = "prompts.zip"):
-    with ZipFile(zip_file_name, "r") as zip_ref:
-        zip_ref.extractall()
+async def _fetch_prompts_into_session(
+    client: GraphragAPI, storage_name: str, limit: int
+) -> None:
+    zip_buffer = await client.agenerate_prompts(storage_name=storage_name, limit=limit)
+    entity_extract, summarize, community = get_prompts_from_zip(zip_buffer)
+    # an incomplete zip must raise so the caller's retry-with-smaller-limit
+    # loop triggers instead of silently reporting success with empty prompts
+    if not (entity_extract and summarize and community):
+        raise ValueError(
+            "Generated prompts zip is missing one or more expected prompt files."
+        )
+    update_session_state_prompt_vars(
+        entity_extract=entity_extract, summarize=summarize, community=community
+    )
 
 
-def open_file(file_path: str | Path):
-    with open(file_path, "r", encoding="utf-8") as file:
-        text = file.read()
-    return text
+def get_prompts_from_zip(zip_buffer: BytesIO):
+    """
+    Extract text for the three LLM prompts directly from the in-memory zip
+    buffer, without writing its members to disk.  Assumes member names comply
+    with pregenerated file name standards.
+    """
+    entity_ext_prompt = summ_prompt = comm_report_prompt = None
+    with ZipFile(zip_buffer, "r") as zip_ref:
+        for member in zip_ref.namelist():
+            name = os.path.basename(member)
+            if not name.endswith(".txt"):
+                continue
+            if name.startswith("entity") and entity_ext_prompt is None:
+                entity_ext_prompt = zip_ref.read(member).decode("utf-8")
+            elif name.startswith("summ") and summ_prompt is None:
+                summ_prompt = zip_ref.read(member).decode("utf-8")
+            elif name.startswith("community") and comm_report_prompt is None:
+                comm_report_prompt = zip_ref.read(member).decode("utf-8")
+            if entity_ext_prompt and summ_prompt and comm_report_prompt:
+                break
+    return entity_ext_prompt, summ_prompt, comm_report_prompt
 
 
 def zip_directory(directory_path: str, zip_path: str):
@@ -154,22 +173,3 @@ def zip_directory(directory_path: str, zip_path: str):
                 relpath = os.path.relpath(file_path, start=directory_path)
                 arcname = os.path.join(root_dir_name, relpath)
                 zipf.write(file_path, arcname)
-
-
-def get_prompts(prompt_dir: str = "./prompts"):
-    """
-    Extract text from generated prompts.  Assumes file names comply with pregenerated file name standards.
-    """
-    prompt_paths = [
-        prompt for prompt in Path(prompt_dir).iterdir() if prompt.name.endswith(".txt")
-    ]
-    entity_ext_prompt = [
-        open_file(path) for path in prompt_paths if path.name.startswith("entity")
-    ][0]
-    summ_prompt = [
-        open_file(path) for path in prompt_paths if path.name.startswith("summ")
-    ][0]
-    comm_report_prompt = [
-        open_file(path) for path in prompt_paths if path.name.startswith("community")
-    ][0]
-    return entity_ext_prompt, summ_prompt, comm_report_prompt
@@ -1,17 +1,131 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
-from io import StringIO
+import asyncio
+import hashlib
+import os
+from contextlib import ExitStack
+from functools import lru_cache
+from io import BytesIO, StringIO
+from pathlib import Path
 
+import httpx
 import requests
 import streamlit as st
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 """
 This module contains the GraphRAG API class for making all external API calls
 presumably to a GraphRAG instance deployed on Azure.
 """
 
+# Shared session so repeated API calls reuse keep-alive connections instead of
+# paying a TCP/TLS handshake per request. The adapter pool is sized to allow
+# multiple concurrent Streamlit sessions to share connections.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Feature flag: HTTP/2 multiplexes the many small GETs issued during a rerun
+# over one TCP/TLS connection instead of serializing them on HTTP/1.1.
+# Set GRAPHRAG_HTTP2=0 to fall back to the requests session. The flag also
+# requires the h2 package, since httpx raises at client creation without it.
+try:
+    import h2  # noqa: F401
+
+    _H2_AVAILABLE = True
+except ImportError:
+    _H2_AVAILABLE = False
+
+_USE_HTTP2 = _H2_AVAILABLE and os.getenv("GRAPHRAG_HTTP2", "1").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+
+# st.cache_data entries are shared across every session of one Streamlit
+# process, and each session can log into a different APIM deployment - so the
+# client identity must be part of the cache key or one user's container and
+# index lists would be served to another. hash_funcs folds the url and key
+# into the key for the otherwise-unhashable client argument.
+_CACHE_HASH_FUNCS = {
+    "src.graphrag_api.GraphragAPI": lambda client: (client.api_url, client.apim_key)
+}
+
+# Connection ceiling shared by the async clients; query fan-out throughput
+# scales with the pool up to this bound.
+_ASYNC_LIMITS = httpx.Limits(max_connections=64)
+
+# Generated prompt zips are cached on disk, validated with the server's ETag,
+# so unchanged storage contents skip the download and regeneration entirely.
+_PROMPTS_CACHE_DIR = Path.home() / ".cache" / "graphrag" / "prompts"
+
+
+def _prompts_cache_entry(api_url: str, storage_name: str, limit: int) -> tuple:
+    """
+    Paths for the cached prompts zip and its ETag, keyed on the request
+    parameters so distinct containers or sample sizes never collide.
+    """
+    key = f"{api_url}|{storage_name}|{limit}"
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return (
+        _PROMPTS_CACHE_DIR / f"{digest}.zip",
+        _PROMPTS_CACHE_DIR / f"{digest}.etag",
+    )
+
+
+def _cached_prompts_etag(zip_path: Path, etag_path: Path) -> str | None:
+    if zip_path.is_file() and etag_path.is_file():
+        return etag_path.read_text()
+    return None
+
+
+def _store_prompts_cache(
+    zip_path: Path, etag_path: Path, content: bytes, etag: str | None
+) -> None:
+    # without an ETag the cache entry could never be validated, so skip it
+    if not etag:
+        return
+    _PROMPTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    zip_path.write_bytes(content)
+    etag_path.write_text(etag)
+
+
+@lru_cache(maxsize=8)
+def _urls(api_url: str) -> dict[str, str]:
+    """
+    Fully-formed endpoint URLs per API base, built once instead of being
+    re-concatenated on every helper call during a rerun.  Values ending in
+    a slash are prefixes for parameterized endpoints.
+    """
+    return {
+        "data": api_url + "/data",
+        "index": api_url + "/index",
+        "health": api_url + "/health",
+        "prompts": api_url + "/index/config/prompts",
+        "query": api_url + "/query/",
+        "streaming_query": api_url + "/experimental/query/global/streaming",
+    }
+
+
+@lru_cache(maxsize=8)
+def _http2_client(api_url: str, apim_key: str) -> httpx.Client:
+    """
+    One HTTP/2 client per (api_url, apim_key) pair, shared across reruns so
+    the TLS handshake is paid once per process.
+    """
+    return httpx.Client(
+        http2=True,
+        base_url=api_url,
+        headers={
+            "Ocp-Apim-Subscription-Key": apim_key,
+            "Content-Type": "application/json",
+        },
+        timeout=60,
+    )
+
 
 class GraphragAPI:
     """
@@ -26,55 +140,125 @@ class GraphragAPI:
             "Content-Type": "application/json",
         }
         self.upload_headers = {"Ocp-Apim-Subscription-Key": self.apim_key}
+        self.urls = _urls(api_url)
 
+    def _get(self, endpoint: str) -> Response | httpx.Response:
+        """
+        GET request against the shared HTTP/2 client when enabled, otherwise
+        the pooled requests session.
+        """
+        if _USE_HTTP2:
+            return _http2_client(self.api_url, self.apim_key).get(endpoint)
+        return _session.get(f"{self.api_url}{endpoint}", headers=self.headers)
+
+    def _get_json(self, endpoint: str) -> dict | None:
+        """
+        Shared GET-and-decode path for the JSON endpoints.  Any sub-400
+        status counts as success (the old == 200 checks missed 201/204),
+        and errors are reported through this single code path instead of a
+        near-copy per helper.
+        """
+        try:
+            response = self._get(endpoint)
+            # status_code < 400 matches requests' Response.ok and also works
+            # on httpx responses, which have no ok attribute
+            if response.status_code < 400:
+                return response.json()
+            else:
+                print(f"Error: {response.status_code} {response.text[:200]}")
+        except Exception as e:
+            print(f"Error: {str(e)}")
+
+    # a short ttl keeps repeated Streamlit reruns (every widget interaction)
+    # from re-hitting the API while still picking up new containers quickly
+    @st.cache_data(ttl=60, show_spinner=False, hash_funcs=_CACHE_HASH_FUNCS)
     def get_storage_container_names(
         self, storage_name_key: str = "storage_name"
-    ) -> list[str] | Response | Exception:
+    ) -> list[str]:
         """
         GET request to GraphRAG API for Azure Blob Storage Container names.
         """
+        payload = self._get_json("/data")
+        return payload.get(storage_name_key, []) if payload is not None else []
+
+    # cached like the single-endpoint helpers: this runs on every script
+    # rerun from app.py, so only a cache miss pays the network round trips
+    @st.cache_data(ttl=60, show_spinner=False, hash_funcs=_CACHE_HASH_FUNCS)
+    def get_storage_and_index_names(
+        self,
+        storage_name_key: str = "storage_name",
+        index_name_key: str = "index_name",
+    ) -> tuple[list[str], list[str]]:
+        """
+        GET request to GraphRAG API for both storage container names and
+        index names.  The two endpoints are independent, so both requests
+        are issued concurrently and total latency is the slower of the two
+        calls instead of their sum.
+        """
+        storage_response, index_response = asyncio.run(self._gather_json_responses())
+        storage_names = (
+            storage_response.get(storage_name_key, []) if storage_response else []
+        )
+        index_names = index_response.get(index_name_key, []) if index_response else []
+        return storage_names, index_names
+
+    async def _gather_json_responses(self) -> tuple[dict | None, dict | None]:
+        """
+        Fetch the /data and /index endpoints concurrently over a shared
+        connection pool.
+        """
+        async with httpx.AsyncClient(
+            base_url=self.api_url, headers=self.headers, timeout=60
+        ) as client:
+            return await asyncio.gather(
+                self._aget_json(client, "/data"),
+                self._aget_json(client, "/index"),
+            )
+
+    async def _aget_json(self, client: httpx.AsyncClient, endpoint: str) -> dict | None:
+        """
+        GET request to a single GraphRAG API endpoint on an existing
+        async client.
+        """
         try:
-            response = requests.get(f"{self.api_url}/data", headers=self.headers)
+            response = await client.get(endpoint)
             if response.status_code == 200:
-                return response.json()[storage_name_key]
+                return response.json()
             else:
                 print(f"Error: {response.status_code}")
-                return response
         except Exception as e:
             print(f"Error: {str(e)}")
-            return e
 
     def upload_files(self, file_payloads: dict, input_storage_name: str):
         """
         Upload files to Azure Blob Storage Container.
         """
         try:
-            response = requests.post(
-                self.api_url + "/data",
+            response = _session.post(
+                self.urls["data"],
                 headers=self.upload_headers,
                 files=file_payloads,
                 params={"storage_name": input_storage_name},
             )
-            if response.status_code == 200:
-                return response
+            return response
         except Exception as e:
             print(f"Error: {str(e)}")
 
-    def get_index_names(
-        self, index_name_key: str = "index_name"
-    ) -> list | Response | None:
+    def clear_name_caches(self) -> None:
+        """
+        Invalidate the cached name lists, e.g. after an upload, so new
+        containers appear on the next rerun without waiting out the ttl.
+        """
+        self.get_storage_container_names.clear()
+        self.get_storage_and_index_names.clear()
+
+    @st.cache_data(ttl=60, show_spinner=False, hash_funcs=_CACHE_HASH_FUNCS)
+    def get_index_names(self, index_name_key: str = "index_name") -> list:
         """
         GET request to GraphRAG API for existing indexes.
         """
-        try:
-            response = requests.get(f"{self.api_url}/index", headers=self.headers)
-            if response.status_code == 200:
-                return response.json()[index_name_key]
-            else:
-                print(f"Error: {response.status_code}")
-                return response
-        except Exception as e:
-            print(f"Error: {str(e)}")
+        payload = self._get_json("/index")
+        return payload.get(index_name_key, []) if payload is not None else []
 
     def build_index(
         self,
@@ -89,40 +273,44 @@ class GraphragAPI:
         This function kicks off a job that builds a knowledge graph (KG)
         index from files located in a blob storage container.
         """
-        url = self.api_url + "/index"
-        prompt_files = dict()
-        if entity_extraction_prompt_filepath:
-            prompt_files["entity_extraction_prompt"] = (
-                open(entity_extraction_prompt_filepath, "r", encoding="utf-8")
-                if isinstance(entity_extraction_prompt_filepath, str)
-                else entity_extraction_prompt_filepath
-            )
-        if community_prompt_filepath:
-            prompt_files["community_report_prompt"] = (
-                open(community_prompt_filepath, "r", encoding="utf-8")
-                if isinstance(community_prompt_filepath, str)
-                else community_prompt_filepath
-            )
-        if summarize_description_prompt_filepath:
-            prompt_files["summarize_descriptions_prompt"] = (
-                open(summarize_description_prompt_filepath, "r", encoding="utf-8")
-                if isinstance(summarize_description_prompt_filepath, str)
-                else summarize_description_prompt_filepath
+        url = self.urls["index"]
+        # open any prompt files inside an ExitStack so the handles are closed
+        # even if the POST raises
+        with ExitStack() as stack:
+            prompt_files = dict()
+            if entity_extraction_prompt_filepath:
+                prompt_files["entity_extraction_prompt"] = (
+                    stack.enter_context(open(entity_extraction_prompt_filepath, "rb"))
+                    if isinstance(entity_extraction_prompt_filepath, str)
+                    else entity_extraction_prompt_filepath
+                )
+            if community_prompt_filepath:
+                prompt_files["community_report_prompt"] = (
+                    stack.enter_context(open(community_prompt_filepath, "rb"))
+                    if isinstance(community_prompt_filepath, str)
+                    else community_prompt_filepath
+                )
+            if summarize_description_prompt_filepath:
+                prompt_files["summarize_descriptions_prompt"] = (
+                    stack.enter_context(
+                        open(summarize_description_prompt_filepath, "rb")
+                    )
+                    if isinstance(summarize_description_prompt_filepath, str)
+                    else summarize_description_prompt_filepath
+                )
+            return _session.post(
+                url,
+                files=prompt_files if len(prompt_files) > 0 else None,
+                params={"index_name": index_name, "storage_name": storage_name},
+                headers=self.headers,
             )
-        return requests.post(
-            url,
-            files=prompt_files if len(prompt_files) > 0 else None,
-            params={"index_name": index_name, "storage_name": storage_name},
-            headers=self.headers,
-        )
 
     def check_index_status(self, index_name: str) -> Response | None:
         """
         Check the status of a running index job.
         """
-        url = self.api_url + f"/index/status/{index_name}"
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._get(f"/index/status/{index_name}")
             if response.status_code == 200:
                 return response
             else:
@@ -135,26 +323,28 @@ class GraphragAPI:
         """
         Check the health of the APIM endpoint.
         """
-        url = self.api_url + "/health"
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._get("/health")
             return response.status_code
         except Exception as e:
             print(f"Error: {str(e)}")
             return e
 
+    # static portion of the query payload, built once and shared across calls
+    _QUERY_REQUEST_DEFAULTS = {"reformat_context_data": True}
+
     def query_index(self, index_name: str | list[str], query_type: str, query: str):
         """
         Submite query to GraphRAG API using specific index and query type.
         """
         try:
             request = {
+                **self._QUERY_REQUEST_DEFAULTS,
                 "index_name": index_name,
                 "query": query,
-                "reformat_context_data": True,
             }
-            response = requests.post(
-                f"{self.api_url}/query/{query_type.lower()}",
+            response = _session.post(
+                self.urls["query"] + query_type.lower(),
                 headers=self.headers,
                 json=request,
             )
@@ -168,15 +358,77 @@ class GraphragAPI:
         except Exception as e:
             st.error(f"Error with {query_type} search: {str(e)}")
 
+    def query_index_batch(
+        self, index_name: str | list[str], query_type: str, queries: list[str]
+    ) -> list[dict | None]:
+        """
+        Submit several queries against the same index concurrently.  Results
+        are returned in the same order as the input queries, with None for
+        any query that failed.
+        """
+        return asyncio.run(self._aquery_index_batch(index_name, query_type, queries))
+
+    async def _aquery_index_batch(
+        self, index_name: str | list[str], query_type: str, queries: list[str]
+    ) -> list[dict | None]:
+        async with self._async_client() as client:
+            return await asyncio.gather(
+                *(
+                    self.aquery_index(index_name, query_type, query, client=client)
+                    for query in queries
+                )
+            )
+
+    def _async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.api_url,
+            headers=self.headers,
+            timeout=None,
+            limits=_ASYNC_LIMITS,
+        )
+
+    async def aquery_index(
+        self,
+        index_name: str | list[str],
+        query_type: str,
+        query: str,
+        client: httpx.AsyncClient | None = None,
+    ) -> dict | None:
+        """
+        Async counterpart to query_index.  Callers fanning out several
+        queries with asyncio.gather get real concurrency here, where a
+        blocking requests call inside a coroutine would serialize them and
+        stall the event loop.  Pass an existing client to share its
+        connection pool across calls.
+        """
+        if client is None:
+            async with self._async_client() as own_client:
+                return await self.aquery_index(
+                    index_name, query_type, query, client=own_client
+                )
+        request = {
+            **self._QUERY_REQUEST_DEFAULTS,
+            "index_name": index_name,
+            "query": query,
+        }
+        try:
+            response = await client.post(f"/query/{query_type.lower()}", json=request)
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"Error: {response.status_code}")
+        except Exception as e:
+            print(f"Error: {str(e)}")
+
     def global_streaming_query(
         self, index_name: str | list[str], query: str
     ) -> Response | None:
         """
         Returns a streaming response object for a global query.
         """
-        url = f"{self.api_url}/experimental/query/global/streaming"
+        url = self.urls["streaming_query"]
         try:
-            query_response = requests.post(
+            query_response = _session.post(
                 url,
                 json={"index_name": index_name, "query": query},
                 headers=self.headers,
@@ -186,29 +438,65 @@ class GraphragAPI:
         except Exception as e:
             print(f"Error: {str(e)}")
 
+    @st.cache_data(ttl=60, show_spinner=False, hash_funcs=_CACHE_HASH_FUNCS)
     def get_source_entity(self, index_name: str, entity_id: str) -> dict | None:
-        try:
-            response = requests.get(
-                f"{self.api_url}/source/entity/{index_name}/{entity_id}",
-                headers=self.headers,
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return response
-        except Exception as e:
-            print(f"Error: {str(e)}")
+        return self._get_json(f"/source/entity/{index_name}/{entity_id}")
 
-    def generate_prompts(
-        self, storage_name: str, zip_file_name: str = "prompts.zip", limit: int = 1
-    ) -> None:
+    def generate_prompts(self, storage_name: str, limit: int = 1) -> BytesIO:
         """
-        Generate graphrag prompts using data provided in a specific storage container.
+        Generate graphrag prompts using data provided in a specific storage
+        container.  The zipped prompts are streamed into memory and returned
+        as a BytesIO buffer, avoiding a round trip through the filesystem.
         """
-        url = self.api_url + "/index/config/prompts"
+        url = self.urls["prompts"]
         params = {"storage_name": storage_name, "limit": limit}
-        with requests.get(url, params=params, headers=self.headers, stream=True) as r:
+        zip_path, etag_path = _prompts_cache_entry(self.api_url, storage_name, limit)
+        headers = self.headers
+        cached_etag = _cached_prompts_etag(zip_path, etag_path)
+        if cached_etag:
+            headers = {**headers, "If-None-Match": cached_etag}
+        zip_buffer = BytesIO()
+        with _session.get(url, params=params, headers=headers, stream=True) as r:
+            if r.status_code == 304:
+                # storage contents unchanged - serve the cached zip
+                return BytesIO(zip_path.read_bytes())
             r.raise_for_status()
-            with open(zip_file_name, "wb") as f:
-                for chunk in r.iter_content():
-                    f.write(chunk)
+            # 1 MB chunks - iter_content() with no size yields single
+            # bytes, costing a python loop iteration and write per byte
+            for chunk in r.iter_content(chunk_size=1 << 20):
+                if chunk:
+                    zip_buffer.write(chunk)
+            _store_prompts_cache(
+                zip_path, etag_path, zip_buffer.getvalue(), r.headers.get("ETag")
+            )
+        zip_buffer.seek(0)
+        return zip_buffer
+
+    async def agenerate_prompts(self, storage_name: str, limit: int = 1) -> BytesIO:
+        """
+        Async variant of generate_prompts.  Streaming on httpx keeps the
+        event loop free while the download is in flight, so callers can
+        overlap other work with the transfer.  Prompt generation runs LLM
+        calls server-side, so no client timeout is applied.
+        """
+        url = self.urls["prompts"]
+        params = {"storage_name": storage_name, "limit": limit}
+        zip_path, etag_path = _prompts_cache_entry(self.api_url, storage_name, limit)
+        headers = self.headers
+        cached_etag = _cached_prompts_etag(zip_path, etag_path)
+        if cached_etag:
+            headers = {**headers, "If-None-Match": cached_etag}
+        zip_buffer = BytesIO()
+        async with httpx.AsyncClient(headers=headers, timeout=None) as client:
+            async with client.stream("GET", url, params=params) as r:
+                if r.status_code == 304:
+                    # storage contents unchanged - serve the cached zip
+                    return BytesIO(zip_path.read_bytes())
+                r.raise_for_status()
+                async for chunk in r.aiter_bytes(1 << 20):
+                    zip_buffer.write(chunk)
+                _store_prompts_cache(
+                    zip_path, etag_path, zip_buffer.getvalue(), r.headers.get("ETag")
+                )
+        zip_buffer.seek(0)
+        return zip_buffer
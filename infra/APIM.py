@@ -1,23 +1,24 @@
-import requests
-
-# Define the subscription key variable
-# Replace "YOUR_SUBSCRIPTION_KEY" with the actual copied key
-ocp_apim_subscription_key = "5ce3cc7433fe48a49e15d06cbb4195e7"
+import os
 
-# Example Headers with Subscription Key
-headers = {
-    "Ocp-Apim-Subscription-Key": ocp_apim_subscription_key
-}
+import requests
 
 # Example endpoint from previously provided data
 endpoint = "https://apim-6b7pszrzqfrdm.azure-api.net"
 
-# Example API Call
-response = requests.get(
-    url=f"{endpoint}/data",
-    headers=headers
-)
 
-# Log the status to verify it's working
-print(response.status_code)
-print(response.json())
\ No newline at end of file
+def _probe(session: requests.Session) -> None:
+    # Example API Call
+    response = session.get(url=f"{endpoint}/data")
+
+    # Log the status to verify it's working
+    print(response.status_code)
+    print(response.json())
+
+
+if __name__ == "__main__":
+    # The subscription key is read from the environment instead of being
+    # committed to source control:
+    #   export APIM_KEY="<your-subscription-key>"
+    session = requests.Session()
+    session.headers.update({"Ocp-Apim-Subscription-Key": os.environ["APIM_KEY"]})
+    _probe(session)